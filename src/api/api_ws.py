@@ -2,17 +2,22 @@ import logging
 import asyncio
 import json
 import time
+import weakref
 
 from websockets.legacy.server import (
     serve,
     WebSocketServerProtocol,
     )
+from websockets.legacy.protocol import broadcast as send_to_all
 from src.hr.heart_rate import HeartRateMonitor
 from src.s4.s4 import RowerState
 
 logger = logging.getLogger(__name__)
 
-clients: set[WebSocketServerProtocol] = set()
+# Held weakly, so that a connection drops out once the server releases it. Closed connections that haven't been collected
+# yet are skipped by send_to_all().
+clients: weakref.WeakSet[WebSocketServerProtocol] = weakref.WeakSet()
+last_message: str | None = None     # The last metrics broadcast, which is sent to clients as they connect
 
 # Example simulated metric data
 def compile_metrics(rower_state: RowerState, hr_monitor: HeartRateMonitor) -> dict[str, int | float | str]:
@@ -37,20 +42,28 @@ def compile_metrics(rower_state: RowerState, hr_monitor: HeartRateMonitor) -> di
     }
 
 async def broadcast(rower_state: RowerState, hr_monitor: HeartRateMonitor) -> None:
+    global last_message
     logger.debug("Preparing broadcast loop")
+    last_metrics = None
     while True:
         if clients:
-            message = json.dumps(compile_metrics(rower_state, hr_monitor))
-            await asyncio.gather(*[client.send(message) for client in clients])
+            metrics = compile_metrics(rower_state, hr_monitor)
+            timestamp = metrics.pop("timestamp")
+            # Skip the encoding and sending while nothing but the timestamp has changed (e.g. the rower is idle)
+            if metrics != last_metrics:
+                last_metrics = metrics
+                message = last_message = json.dumps({"timestamp": timestamp, **metrics})
+                # Encodes and frames the message once for all clients, and skips any client whose connection has dropped
+                # rather than failing the whole broadcast
+                send_to_all(clients, message)
         await asyncio.sleep(1)
 
 async def handler(websocket: WebSocketServerProtocol) -> None:
     logger.debug("Handling new client connection")
     clients.add(websocket)
-    try:
-        await websocket.wait_closed()
-    finally:
-        clients.remove(websocket)
+    if last_message is not None:
+        await websocket.send(last_message)   # Broadcasts are skipped while nothing changes, so don't leave a new client blank
+    await websocket.wait_closed()
 
 async def ws_task(rower_state: RowerState, hr_monitor: HeartRateMonitor) -> None:
     logger.debug("Starting websocket server")
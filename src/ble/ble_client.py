@@ -335,11 +335,11 @@ class HeartRateBLEScanner(threading.Thread):
         
             # Record the heart rate in the HeartRateMonitor class
             self.hr_monitor.update_heart_rate(hr_value)
-            logger.debug(f"Heart rate received: {hr_value} bpm")
+            logger.debug("Heart rate received: %s bpm", hr_value)
             
             contact_status_str = CONTACT_STATUS_MEANING.get(contact_status)
             self.hr_monitor.update_skin_contact_detected(contact_status_str)
-            logger.debug(f"HRM sensor skin contact: {contact_status_str}")
+            logger.debug("HRM sensor skin contact: %s", contact_status_str)
             
             # Energy expenditure (2 bytes)
             # If supported, typically sent once every 10 measurements at regular intervals 
@@ -349,7 +349,7 @@ class HeartRateBLEScanner(threading.Thread):
                     energy_exp = int.from_bytes(data[index:index + 2], byteorder="little")
                     index += 2
                     self.hr_monitor.update_energy_expended(energy_exp)
-                    logger.debug(f"Energy expenditure: {energy_exp} kcal")
+                    logger.debug("Energy expenditure: %s kcal", energy_exp)
                 else:
                     logger.warning("Energy expenditure flag set but data is too short.")
 
@@ -363,7 +363,7 @@ class HeartRateBLEScanner(threading.Thread):
                     rr_intervals.append(rr)
                     index += 2
                 self.hr_monitor.update_rr_intervals(rr_intervals)
-                logger.debug(f"RR Intervals: {rr_intervals}")
+                logger.debug("RR Intervals: %s", rr_intervals)
 
         except Exception as e:
             logger.warning(f"Failed to handle heart rate data: {e}")
@@ -182,15 +182,15 @@ class AppRowerData(RowerData):
             logger.warning("No WaterRower values available yet.")
             return self.notifying
         
-        logger.debug(f"Got values: {wr_values}")
+        logger.debug("Got values: %s", wr_values)
         wr_values = inject_heart_rate(wr_values, self.hr_monitor)
         ble_rower_data = {
             ble_key: int(func(wr_values) or 0) 
             for ble_key, func in BLE_FIELD_MAP.items()
         }
-        logger.debug(f"Mapped rower values to ble fields: {ble_rower_data}")
+        logger.debug("Mapped rower values to ble fields: %s", ble_rower_data)
         payload_bytes = self.encode(ble_rower_data)
-        logger.debug(f"Generated payload: {payload_bytes}")
+        logger.debug("Generated payload: %s", payload_bytes)
         if self.last_payload != payload_bytes:
             logger.debug("Changed values in payload, so starting transmission")
             self.last_payload = payload_bytes
@@ -289,7 +289,7 @@ def inject_heart_rate(values, hrm: HeartRateMonitor):
     if values.get('heart_rate_bpm', 0) == 0:
         logger.debug("heart rate in dict is 0 so getting external hr")
         ext_hr = hrm.get_heart_rate()
-        logger.debug(f"external heart rate got at: {ext_hr}")
+        logger.debug("external heart rate got at: %s", ext_hr)
         if ext_hr:
             values['heart_rate_bpm'] = ext_hr
     return values
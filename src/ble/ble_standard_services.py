@@ -8,7 +8,7 @@ else:
 import logging
 import struct
 from enum import IntEnum, IntFlag
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Tuple
 
 import src.ble.ble_constants as blec
@@ -303,13 +303,18 @@ class BLEField:
     format: str  # Format of the data (e.g. 'B', 'H', 'h', 'I') using the standard format chars of the struct module.
     size: int
     signed: bool = False
+    _struct: struct.Struct | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Compile the little-endian format once rather than on every encode.
+        # struct doesn't support 3-byte fields, so those are left to to_bytes.
+        self._struct = None if self.size == 3 else struct.Struct('<' + self.format)
 
     def to_bytes(self, value: int) -> bytes:
-        if self.size == 3:
-            # struct doesn't support 3-byte fields, so use to_bytes directly
+        if self._struct is None:
             return value.to_bytes(3, byteorder='little', signed=self.signed)
         else:
-            return struct.pack('<' + self.format, value)
+            return self._struct.pack(value)
         
 # Map of BLE Rower Data flags defining the content of each BLE transmission.
 # The code currently does not robustly support legacy or limited devices which utilise a small MTU (the max number of 
@@ -337,6 +342,8 @@ class BLEField:
 # because the specifications could not be found in the bluetooth.com specs. 
 
 
+_FLAGS_FIELD = struct.Struct('<H')
+
 FIELD_GROUPS = [                                                                            ### CORRESPONDING Fitness Machine Feature Support bit ###
     (RowingFieldFlags.STROKE_INFO, [                                                        # No corresponding Feature bit
         BLEField("stroke_rate", "B", 1),    # uint8    
@@ -380,15 +387,15 @@ class RowerData(Characteristic):
         flags ^= RowingFieldFlags.STROKE_INFO
         
         output = bytearray()
-        output += struct.pack("<H", flags)  # 2-byte flags field
+        output += _FLAGS_FIELD.pack(flags)  # 2-byte flags field
 
         logger.debug("Encode loop - starting iteration through fields groups")
 
-        for field, value in fields_to_encode:
-            logger.debug(f"Build output byte array. Append field: {field.name}")
-            output += field.to_bytes(value)
+        for ble_field, value in fields_to_encode:
+            logger.debug("Build output byte array. Append field: %s", ble_field.name)
+            output += ble_field.to_bytes(value)
 
-        logger.debug(f"Bluetooth payload complete: {output}")
+        logger.debug("Bluetooth payload complete: %s", output)
         return bytes(output)
     
     def _prepare_fields_and_flags(self, field_values: dict[str, Any]) -> tuple[RowingFieldFlags, list[tuple[BLEField, Any]]]:
@@ -7,10 +7,12 @@ logger = logging.getLogger(__name__)
 
 # Tolerable timeframe in seconds for heart rate (e.g., 10 seconds)
 HRM_TIMEOUT = 10
+HRM_TIMEOUT_NS = HRM_TIMEOUT * 1_000_000_000
 
 class HeartRateMonitor:
-    def __init__(self):
+    def __init__(self, clock=time.monotonic_ns):
         self._lock = threading.Lock()
+        self._clock = clock     # Monotonic nanosecond clock for the staleness check. Injectable for tests.
         self.manufacturer = None
         self.model = None
         self.serial_nr = None
@@ -21,6 +23,7 @@ class HeartRateMonitor:
         self.battery_level = None
         self.heart_rate = None
         self.heart_rate_ts = None
+        self._heart_rate_ns = None  # Monotonic stamp used for the staleness check
         self.rr_intervals = None
         self.rr_intervals_ts = None
         self.energy_expended = None
@@ -59,7 +62,7 @@ class HeartRateMonitor:
     def update_skin_contact_detected(self, data) -> None:
         with self._lock:
             self.skin_contact_detected = data
-        logger.debug(f"HRM skin_contact_detected updated: {data}")
+        logger.debug("HRM skin_contact_detected updated: %s", data)
 
     def update_battery_level(self, data) -> None:
         with self._lock:
@@ -70,19 +73,20 @@ class HeartRateMonitor:
         with self._lock:
             self.heart_rate = hr
             self.heart_rate_ts = time.time()
-        logger.debug(f"HRM heart rate updated: {hr} at {self.heart_rate_ts}")
+            self._heart_rate_ns = self._clock()
+        logger.debug("HRM heart rate updated: %s at %s", hr, self.heart_rate_ts)
 
     def update_rr_intervals(self, data) -> None:
         with self._lock:
             self.rr_intervals = data
             self.rr_intervals_ts = time.time()
-        logger.debug(f"HRM rr_intervals updated: {data} at {self.rr_intervals_ts}")
+        logger.debug("HRM rr_intervals updated: %s at %s", data, self.rr_intervals_ts)
 
     def update_energy_expended(self, data) -> None:
         with self._lock:
             self.energy_expended = data
             self.energy_expended_ts = time.time()
-        logger.debug(f"HRM energy_expended updated: {data} at {self.energy_expended_ts}")
+        logger.debug("HRM energy_expended updated: %s at %s", data, self.energy_expended_ts)
 
     def get_heart_rate(self) -> int:
         """
@@ -92,15 +96,14 @@ class HeartRateMonitor:
         hr = 0
         with self._lock:
             if self.heart_rate and self.heart_rate > 0:
-                if self.heart_rate_ts is not None:
-                    age_seconds = time.time() - self.heart_rate_ts
-                    age = f"{age_seconds:.2f}"
+                if self._heart_rate_ns is not None:
+                    age_ns = self._clock() - self._heart_rate_ns
 
-                    if age_seconds < HRM_TIMEOUT:
+                    if age_ns < HRM_TIMEOUT_NS:
                         hr = self.heart_rate
-                        logger.debug(f"Got valid heart rate: {hr} (age: {age}s)")
+                        logger.debug("Got valid heart rate: %s (age: %.2fs)", hr, age_ns / 1e9)
                     else:
-                        logger.debug(f"Heart rate data is stale: age: {age}s")
+                        logger.debug("Heart rate data is stale: age: %.2fs", age_ns / 1e9)
                 else:
                     logger.debug("Heart rate data has invalid timestamp.")
             else:
@@ -122,7 +125,7 @@ class HeartRateMonitor:
         if values.get('heart_rate_bpm', 0) == 0:
             logger.debug("heart rate in dict is 0 so getting external hr")
             ext_hr = self.get_heart_rate()
-            logger.debug(f"external heart rate got at: {ext_hr}")
+            logger.debug("external heart rate got at: %s", ext_hr)
             if ext_hr:
                 values['heart_rate_bpm'] = ext_hr
         return values
@@ -10,6 +10,7 @@ import logging
 import time
 import re
 from gpiozero import DigitalOutputDevice
+from collections import deque
 from copy import deepcopy
 from typing import Any, Callable
 
@@ -145,7 +146,7 @@ class RowerState(object):
         self._stop_event = threading.Event()
         self._wr_lock = threading.RLock()
 
-        self._recent_strokes_max_power: list[int] = []
+        self._recent_strokes_max_power: deque[int] = deque(maxlen=NUM_STROKES_FOR_ROLLING_AVG_WATTS)   # The oldest stroke drops out as each new one is added
         self._stroke_max_power: int | None = None
         self._drive_phase: bool | None = None         # Our _drive_phase is set to True at when the S4 determines pulley accelleration
                                         # and set to False when S4 detects pulley decelleration. It is therefore True
@@ -210,7 +211,7 @@ class RowerState(object):
         logger.debug("RowerState._zero_state: Attempting lock")
         with self._wr_lock:
             logger.debug("RowerState._zero_state: Lock attained, setting values")
-            self._recent_strokes_max_power = []
+            self._recent_strokes_max_power.clear()
             self._stroke_max_power = 0
             self._drive_phase = False
             self._watts_event_value = 0
@@ -257,10 +258,10 @@ class RowerState(object):
         logger.debug("RowerState._zero_state: Lock released.")
 
     def on_rower_event(self, event: S4Event) -> None:
-        #logger.debug(f"Received event: {event}")
+        #logger.debug("Received event: %s", event)
 
         if event.type in IGNORE_LIST:
-            #logger.debug(f"Ignoring event in ignore list: {event.type}")
+            #logger.debug("Ignoring event in ignore list: %s", event.type)
             return
 
         handlers: dict[str, tuple[Callable[[S4Event], None] | None, int | None]] = {
@@ -345,9 +346,9 @@ class RowerState(object):
                 handler_func(event)
             if log_level is not None:
                 self._log_s4data(event, log_level)
-            # In the memory map, the time components are listed in order of increasing signficance: dec, sec, min, hr
-            # and so are requested and also responded in that order. Therefore the elapsed time can be calculated
-            # on receipt of the hr response.
+            # The time components are requested in order of decreasing significance: hr, then min, sec and dec
+            # (one composite read), and so are also responded in that order. Therefore the elapsed time can be
+            # calculated on receipt of the dec response.
             if event.type == 'display_sec_dec':
                 self._compute_elapsed_time()
                 
@@ -417,6 +418,9 @@ class RowerState(object):
 
     def _handle_avg_time_stroke_whole(self, evt: S4Event) -> None:
         with self._wr_lock:
+            # avg_time_stroke_whole is in 25ms periods, so stroke rate = 60000 / (avg_time_stroke_whole * 25).
+            # This is more precise than the S4's own stroke_rate register (1A9), which holds whole strokes per minute only,
+            # so 1A9 is not polled.
             duration_ms = (evt.value or 0) * 25
             self._stroke_duration = duration_ms
             self.WRValues['stroke_rate_pm'] = round(60000 / duration_ms if duration_ms else 0, 2)
@@ -436,7 +440,9 @@ class RowerState(object):
             self.WRValues['speed_cmps'] = speed
 
             # Prefer using the 500mPace from the S4 if it is being captured and not ignored.
-            # Otherwise compute the 500m pace from the speed.
+            # Otherwise compute the 500m pace from the speed: 500m = 50000cm, so pace (secs) = 50000 / speed (cm/s).
+            # The S4's 500m_pace register (1A5) is populated only when pace is shown on the monitor, so by default
+            # it is not polled and this derived value is always used.
             if not self._500m_pace:
                 pace_500m = 50000 / speed
                 self.WRValues['instant_500m_pace_secs'] = round(pace_500m)
@@ -457,8 +463,6 @@ class RowerState(object):
                 if self._stroke_max_power:
                     self._recent_strokes_max_power.append(self._stroke_max_power)
                     self._stroke_max_power = 0
-                while len(self._recent_strokes_max_power) > NUM_STROKES_FOR_ROLLING_AVG_WATTS:
-                    self._recent_strokes_max_power.pop(0)
                 # Start reporting power from the first received value, rather than waiting for the buffer to fill
                 if self._recent_strokes_max_power:
                     rolling_avg_watts = round(sum(self._recent_strokes_max_power) / len(self._recent_strokes_max_power))
@@ -521,12 +525,12 @@ class RowerState(object):
         
         if oldvalue is not None:
             if oldvalue != value:
-                self._data_logger.info(f"{eventtype} updated to: {value!r} from {oldvalue!r}")
+                self._data_logger.info("%s updated to: %r from %r", eventtype, value, oldvalue)
                 self._logger_cache[eventtype] = value
             else:
-                logger.debug(f"No change in value for {evt}")
+                logger.debug("No change in value for %s", evt)
         else:
-            self._data_logger.info(f"{eventtype} initialised at: {value!r}")
+            self._data_logger.info("%s initialised at: %r", eventtype, value)
             self._logger_cache[eventtype] = value
 
 
@@ -562,7 +566,7 @@ class RowerState(object):
         # thereby allowing the time since the last pulse to be computed. If this is
         # longer than the NO_ROWING_PULSE_GAP in milliseconds (e.g. 300ms), then the 
         # paddle is assumed to be stationary and no rowing is taking place.
-        self._last_check_for_pulse = int(round(time.time() * 1000))
+        self._last_check_for_pulse = time.time_ns() // 1_000_000
         with self._wr_lock:
             if event.type == 'pulse':
                 self._pulse_event_time = event.at
@@ -577,7 +581,7 @@ class RowerState(object):
             else:
                 self._paddle_turning = False
                 self._drive_phase = False
-                self._recent_strokes_max_power = []
+                self._recent_strokes_max_power.clear()
                 self.WRValuesStandstill()
             self.WRValues["paddle_turning"] = self._paddle_turning  #TK
 
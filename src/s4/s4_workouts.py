@@ -10,6 +10,29 @@ from src.s4.s4if import (
 
 logger = logging.getLogger(__name__)
 
+_DISTANCE_UNIT_MAP = {
+    DistanceMode.UNITS_METRES: "metres",
+    DistanceMode.UNITS_MILES: "miles",
+    DistanceMode.UNITS_KM: "km",
+    DistanceMode.UNITS_STROKES: "strokes",
+}
+
+_INTENSITY_UNIT_MAP = {
+    IntensityMode.UNITS_MPS: "mps",
+    IntensityMode.UNITS_MPH: "mph",
+    IntensityMode.UNITS_SECS_500m: "500m_pace",
+    IntensityMode.UNITS_SECS_2KM: "2km_pace",
+}
+
+_ZONE_LABEL_MAP = {
+    'hr': 'bpm',
+    'mps': 'mps',
+    'mph': 'mph',
+    '500m_pace': '500m_pace',
+    '2km_pace': '2km_pace',
+    'sr': 'spm',
+}
+
 class Workout:
     def __init__(self):
         self._workout_flags: int | None = None
@@ -70,13 +93,7 @@ class Workout:
                 # No unit selected yet.
                 return
 
-            unit_map = {
-                DistanceMode.UNITS_METRES: "metres",
-                DistanceMode.UNITS_MILES: "miles",
-                DistanceMode.UNITS_KM: "km",
-                DistanceMode.UNITS_STROKES: "strokes",
-            }
-            self.units = unit_map.get(selected_unit)
+            self.units = _DISTANCE_UNIT_MAP.get(selected_unit)
             return
 
         # Match type like 'workout_work3' or 'workout_rest2'
@@ -114,12 +131,12 @@ class Workout:
             if self.intervals == 0:
                 logger.warning("An interval workout is selected, but the interval count is set at 0")
                 return False
-            expected_intervals = (len(self.work_targets) + len(self.rest_durations))
-            if expected_intervals > self.intervals:
+            total = len(self.work_targets) + len(self.rest_durations)
+            if total > self.intervals:
                 logger.warning(f"The interval count reported by the S4 is less than the number of work and rest periods")
                 return False
             else:
-                return (len(self.work_targets) + len(self.rest_durations)) == self.intervals # Workout is valid if the number of work and rest periods equal the number of expected intervals
+                return total == self.intervals # Workout is valid if the number of work and rest periods equal the number of expected intervals
         else:
             if self.intervals and self.intervals > 1:
                 logger.warning("Non-interval workout has multiple intervals set")
@@ -218,23 +235,8 @@ class Zone:
                 # No unit selected yet.
                 return
 
-            unit_map = {
-                IntensityMode.UNITS_MPS: "mps",
-                IntensityMode.UNITS_MPH: "mph",
-                IntensityMode.UNITS_SECS_500m: "500m_pace",
-                IntensityMode.UNITS_SECS_2KM: "2km_pace",
-            }
-            self.units = unit_map.get(selected_unit)
+            self.units = _INTENSITY_UNIT_MAP.get(selected_unit)
             return
-        
-        label_map = {
-            'hr': 'bpm',
-            'mps': 'mps',
-            'mph': 'mph',
-            '500m_pace': '500m_pace',
-            '2km_pace': '2km_pace',
-            'sr': 'spm',
-        }
 
         match = re.match(r"zone_(int_)?([a-z0-9]+)_(upper|lower)", evt.type)
         if not match:
@@ -242,7 +244,7 @@ class Zone:
 
         short_label = match.group(2)
         bound_type = match.group(3)
-        key = label_map.get(short_label)
+        key = _ZONE_LABEL_MAP.get(short_label)
         
         if key in self.bounds:
             current_lower, current_upper = self.bounds[key]
@@ -8,15 +8,42 @@
 
 import threading
 import logging
+import functools
+import glob
+import os
+import queue
+import select
 
 import time
 import serial
-import serial.tools.list_ports
 
 from enum import IntFlag
-from dataclasses import dataclass
-from typing import Any, Optional, Callable
-
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from typing import Any, Optional, Callable, Iterator, Mapping
+
+
+__all__ = [
+    # Interface
+    'Rower', 'S4Event', 'SerialNotConnectedError', 'EventParseError',
+    # Flag registers
+    'WorkoutMode', 'DistanceMode', 'IntensityMode',
+    # Memory map and the tables compiled from it
+    'DEFAULT_REQUEST_CATEGORIES', 'MEMORY_MAP', 'MEMORY_ENTRIES', 'MemEntry', 'COMPOSITE_READS', 'CompositeRead',
+    'SIZE_MAP', 'SIZE_BYTES', 'SIZE_PARSE_MAP', 'UNIT_MAP', 'EXPECTED_RESPONSE_MAP', 'REQUEST_FRAME', 'READ_MEMORY_PREFIX',
+    # Packet identifiers
+    'USB_REQUEST', 'MODEL_INFORMATION_REQUEST', 'READ_MEMORY_REQUEST', 'RESET_REQUEST', 'EXIT_REQUEST',
+    'WR_RESPONSE', 'MODEL_INFORMATION_RESPONSE', 'READ_MEMORY_RESPONSE', 'STROKE_START_RESPONSE', 'STROKE_END_RESPONSE',
+    'PULSE_COUNT_RESPONSE', 'OK_RESPONSE', 'PING_RESPONSE', 'ERROR_RESPONSE', 'INTERACTIVE_KEYPAD_RESET_RESPONSE',
+    'USB_REQUEST_B', 'EXIT_REQUEST_B', 'RESET_REQUEST_B',
+    # Framing
+    'LINE_TERMINATOR', 'MAX_PARTIAL_FRAME', 'FRAME_UNKNOWN', 'FRAME_READ_MEMORY', 'FRAME_STROKE_START',
+    'FRAME_STROKE_END', 'FRAME_PULSE', 'FRAME_OK', 'FRAME_PING', 'FRAME_ERROR', 'FRAME_WR', 'FRAME_MODEL', 'FRAME_INTERACTIVE',
+    'classify', 'iter_frames',
+    # Helpers
+    'get_poll_plan', 'find_port', 'get_address_of_data_type', 'build_daemon', 'is_live_thread', 'read_reply', 'read_replies',
+    'get_command_string',
+]
 
 logger = logging.getLogger(__name__)
 
@@ -61,11 +88,18 @@ Control the frequency of requests on the serial connection using the constants b
 # PROGRAM CONTROL DELAYS
 PORT_SCAN_RETRY_DELAY = 5       # Default = 5 secs
 SERIAL_OPEN_RETRY_DELAY = 5     # Default = 5 secs
-SERIAL_REQUEST_DELAY = 0.025    # The delay inserted between successive requests written to the serial device. Default = 0.025 secs
+SERIAL_REQUEST_DELAY = 0.025    # The longest delay between successive requests written to the serial device. The request loops
+                                # move on to the next request as soon as the response to the last one has been received, and
+                                # only wait this long when it hasn't (e.g. it was lost). Default = 0.025 secs
 SERIAL_READ_TIMEOUT = 0.01      # The maximum time allowed for each serial read. This ensures that the read operation 
                                 # does not block for too long, allowing the lock to be released promptly (e.g. in the case 
                                 # of an empty buffer or no data available). Reads typically take ~0.0015 and almost always <0.005.
                                 # Default = 0.01 secs 
+SERIAL_IDLE_WAIT = 0.1          # The longest the capture thread sleeps waiting for data from the S4 when the serial device
+                                # can be waited on (POSIX). It wakes as soon as data arrives, so this only bounds how long
+                                # it takes to notice a stop request. Default = 0.1 secs
+SERIAL_WRITE_TIMEOUT = 0.5      # The maximum time allowed for each serial write, so that a stalled port raises (and is reopened)
+                                # rather than blocking the writer, with the serial lock held, indefinitely. Default = 0.5 secs
 HIGH_FREQ_PAUSE = 0             # Delay inserted every 10 requests of high-frequency request loop.
                                 # Set a small value (e.g. 0.1) if incoming data appears sluggish or jerky
                                 # which could indicate the read thread is being starved of serial access.
@@ -327,6 +361,8 @@ Notes:
     components since last received and being confident only in values that match the last reported set.
     As the most significant components (hr and min) are least volatile, it makes sense to request them first because
     they are less likely to change over the short period of time when you are requesting and receiving the time components.
+    The min, sec and sec_dec components are adjacent, so they are now fetched together by one composite read (see
+    COMPOSITE_READS) and can't be skewed relative to each other. Only hr, which changes least often, is requested separately.
 (*) workout_total_time, _metres and _strokes are updated at the end of every work interval. They are tallys of
     all the work intervals.
 (*) workout_limit acts as a tally of the workout phases of the intervals. For distance based intervals, the distance of 
@@ -439,9 +475,10 @@ UNIT_MAP = {
     'strokes': 4,
     }
 
-SIZE_PARSE_MAP = {'single': lambda cmd: cmd[6:8],
-                  'double': lambda cmd: cmd[6:10],
-                  'triple': lambda cmd: cmd[6:12]}
+# The position of the value in a read memory response of each size, e.g. cmd[SIZE_PARSE_MAP['double']]
+SIZE_PARSE_MAP = {'single': slice(6, 8),
+                  'double': slice(6, 10),
+                  'triple': slice(6, 12)}
 
 EXPECTED_RESPONSE_MAP = {
     USB_REQUEST: WR_RESPONSE, 
@@ -451,7 +488,351 @@ EXPECTED_RESPONSE_MAP = {
     READ_MEMORY_REQUEST: READ_MEMORY_RESPONSE,
 }
 
+# REQUEST FRAMES
+'''
+The packets sent to the S4 never change, so they are encoded once at import time and written to the serial
+port as is, rather than being concatenated and encoded on every request.
+'''
+
+LINE_TERMINATOR = b'\r\n'
+
+READ_MEMORY_PREFIX = {size: prefixes['request'].encode('ascii') for size, prefixes in SIZE_MAP.items()}
+
+USB_REQUEST_B = USB_REQUEST.encode('ascii') + LINE_TERMINATOR
+EXIT_REQUEST_B = EXIT_REQUEST.encode('ascii') + LINE_TERMINATOR
+RESET_REQUEST_B = RESET_REQUEST.encode('ascii') + LINE_TERMINATOR
+
+@functools.lru_cache(maxsize=256)
+def _encode_request(raw: str) -> bytes:
+    # Requests built at run time (e.g. on demand) come from a small set too, so each is encoded once and then reused
+    return raw.upper().encode('ascii') + LINE_TERMINATOR
+
+# VALUE DECODERS
+'''
+Each register is decoded straight from the ACH characters of its response payload by a function chosen once, at
+import time, from its base, size and endian, so nothing is compared or byte-swapped per response. The S4 sends the
+highest address first, so a 'big' endian register is parsed as received, while a 'little' endian register is
+converted with int.from_bytes(..., 'little') to reverse its bytes.
+'''
+
+SIZE_BYTES = {'single': 1, 'double': 2, 'triple': 3}
+_SIZE_NAMES = {n_bytes: size for size, n_bytes in SIZE_BYTES.items()}
+
+# The base 10 registers (the display clock) hold one binary coded decimal byte each, which the S4 sends as two
+# decimal digits. They are decoded by lookup rather than by parsing the digits with int().
+_BCD_LUT: dict[str, int] = {f"{i:02d}": i for i in range(100)}
+
+def _value_decoder(base: int, size: str, endian: str) -> Callable[[str], int]:
+    if base == 10:
+        return _BCD_LUT.__getitem__
+    if endian == 'little' and SIZE_BYTES[size] > 1:
+        return lambda ach: int.from_bytes(bytes.fromhex(ach), 'little')
+    return lambda ach: int(ach, 16)
+
+# COMPILED MEMORY MAP
+'''
+MEMORY_MAP is kept as plain dicts so that it is easy to read and edit. At import time each entry is compiled into a
+frozen MemEntry, with the string settings resolved into the values that the request and capture loops actually use
+(byte count, frequency flags, request packet, and a value decoder for the register's base and endian), so those loops
+never have to look them up or compare them again.
+'''
+
+@dataclass(frozen=True, slots=True)
+class MemEntry:
+    address: str
+    addr: int                           # The address as an integer, for arithmetic on addresses
+    type: str
+    size: int                           # Number of bytes (1, 2 or 3)
+    high: bool                          # True if the register is polled by the high frequency request loop
+    category: str
+    exclude: bool                       # True if the register is excluded from the poll loops
+    request_frame: bytes                # The read memory request packet for the register
+    response_header: str                # The start of the read memory response for the register (e.g. 'IDD055')
+    decode: Callable[[str], int]        # Decodes the register's ACH characters into its value
+
+    @classmethod
+    def compile(cls, address: str, meta: dict[str, Any]) -> 'MemEntry':
+        size = meta['size']
+        endian = meta.get('endian', 'big')
+        return cls(
+            address=address,
+            addr=int(address, 16),
+            type=meta['type'],
+            size=SIZE_BYTES[size],
+            high=meta.get('frequency', 'high') == 'high',
+            category=meta.get('category', 'default'),
+            exclude=meta.get('exclude_from_poll_loop', False),
+            request_frame=READ_MEMORY_PREFIX[size] + address.encode('ascii') + LINE_TERMINATOR,
+            response_header=SIZE_MAP[size]['response'] + address,
+            decode=_value_decoder(meta['base'], size, endian),
+        )
+
+# The compiled entries are held in one tuple, in MEMORY_MAP order, which is what the import time passes below iterate.
+# They are looked up by address through read-only views, so that they can't be changed behind the back of the tables
+# derived from them.
+_ENTRIES: tuple[MemEntry, ...] = tuple(MemEntry.compile(address, meta) for address, meta in MEMORY_MAP.items())
+
+MEMORY_ENTRIES: Mapping[str, MemEntry] = MappingProxyType({entry.address: entry for entry in _ENTRIES})
+
+REQUEST_FRAME: Mapping[str, bytes] = MappingProxyType({entry.address: entry.request_frame for entry in _ENTRIES})
+
+# The address of each data type. Built in reverse so that, as with a scan of MEMORY_MAP, the first address wins if a type is repeated.
+_ADDRESS_OF_TYPE: dict[str, str] = {entry.type: entry.address for entry in reversed(_ENTRIES)}
+
+# The (request, expected response prefix) strings for an on-demand read of each register, so that a read memory request
+# doesn't have to build them with two calls to get_command_string().
+_READ_COMMANDS: dict[str, tuple[str, str]] = {
+    entry.address: (SIZE_MAP[_SIZE_NAMES[entry.size]]['request'] + entry.address, entry.response_header) for entry in _ENTRIES
+}
+
+# COMPOSITE READS
+'''
+Adjacent registers can be fetched with a single read memory request that is wide enough to span them all. Because the
+S4 sends the highest address first, the part of the payload belonging to each register is exactly what a read of that
+register alone would return, so each register is decoded with its own MemEntry. Events are emitted in the order the
+registers are received (highest address first). This means that display_sec_dec, which triggers the elapsed time
+calculation, is emitted after the rest of the clock.
+Composite reads are found by a coalescing pass over MEMORY_MAP at import time: registers that are polled at the same
+frequency, belong to the same category (categories are switched on and off together at runtime) and follow on from
+each other without a gap are merged, lowest address first, into reads of up to 3 bytes (a triple). E.g. the display
+clock's min, sec and sec_dec are read as one snapshot, so they can't be skewed relative to each other (see notes above).
+Registers spanned by a composite read are no longer polled individually, but can still be requested individually.
+COMPOSITE_READS maps the start address of each composite read to its size.
+'''
+
+@dataclass(frozen=True, slots=True)
+class CompositeRead:
+    address: str
+    category: str
+    high: bool
+    request_frame: bytes
+    response_header: str
+    fields: tuple[tuple[int, MemEntry], ...]    # (offset of the register's ACH characters in the payload, register) in the order received
+
+    @classmethod
+    def compile(cls, address: str, size: str) -> 'CompositeRead':
+        start = int(address, 16)
+        end = start + SIZE_BYTES[size]
+        entries = sorted(
+            (entry for entry in _ENTRIES if start <= entry.addr < end),
+            key=lambda entry: entry.addr,
+            reverse=True,
+        )
+        if sum(entry.size for entry in entries) != end - start or entries[0].addr + entries[0].size > end:
+            raise ValueError(f"Composite read of {size} at {address} does not exactly span registers configured in MEMORY_MAP")
+        if len({(entry.high, entry.category, entry.exclude) for entry in entries}) != 1 or entries[0].exclude:
+            raise ValueError(f"Composite read of {size} at {address} spans registers with different poll settings")
+
+        return cls(
+            address=address,
+            category=entries[0].category,
+            high=entries[0].high,
+            request_frame=READ_MEMORY_PREFIX[size] + address.encode('ascii') + LINE_TERMINATOR,
+            response_header=SIZE_MAP[size]['response'] + address,
+            fields=tuple((2 * (end - entry.addr - entry.size), entry) for entry in entries),
+        )
+
+def _coalesce_registers() -> dict[str, str]:
+    runs: list[list[MemEntry]] = []
+    for entry in sorted((entry for entry in _ENTRIES if not entry.exclude), key=lambda entry: entry.addr):
+        run = runs[-1] if runs else None
+        if (
+            run
+            and entry.addr == run[-1].addr + run[-1].size
+            and entry.high == run[0].high
+            and entry.category == run[0].category
+            and sum(member.size for member in run) + entry.size <= SIZE_BYTES['triple']
+        ):
+            run.append(entry)
+        else:
+            runs.append([entry])
+
+    return {run[0].address: _SIZE_NAMES[sum(member.size for member in run)] for run in runs if len(run) > 1}
+
+COMPOSITE_READS: Mapping[str, str] = MappingProxyType(_coalesce_registers())
+
+_COMPOSITES: tuple[CompositeRead, ...] = tuple(CompositeRead.compile(address, size) for address, size in COMPOSITE_READS.items())
+
+# The composite read that fetches each register, if any
+_COMPOSITE_BY_ADDRESS: dict[str, CompositeRead] = {
+    entry.address: composite for composite in _COMPOSITES for _, entry in composite.fields
+}
+
+'''
+The decoding of each read memory response is driven by a table keyed by the response header (e.g. 'IDD055'). Each
+entry holds the number of ACH characters in the payload and the (offset, MemEntry) fields to decode from it. A
+response is therefore decoded with a single dict lookup, and a response whose size code doesn't match MEMORY_MAP
+is rejected rather than being misread.
+'''
+_READ_DECODERS: dict[str, tuple[int, tuple[tuple[int, MemEntry], ...]]] = {
+    entry.response_header: (2 * entry.size, ((0, entry),)) for entry in _ENTRIES
+}
+_READ_DECODERS.update({
+    composite.response_header: (2 * SIZE_BYTES[COMPOSITE_READS[composite.address]], composite.fields) for composite in _COMPOSITES
+})
+
+# RESPONSE FRAMING
+'''
+Every packet from the S4 is terminated by LINE_TERMINATOR, so the capture loop reads whatever is waiting in the
+serial buffer in one go and splits it into frames, rather than reading it line by line. Each frame is tagged by its
+response prefix so that the consumer doesn't have to repeat the string comparisons to find out what it is.
+'''
+
+MAX_PARTIAL_FRAME = 64   # S4 packets are at most a dozen or so bytes, so anything longer without a terminator is noise
+
+FRAME_UNKNOWN = -1
+FRAME_READ_MEMORY = 0
+FRAME_STROKE_START = 1
+FRAME_STROKE_END = 2
+FRAME_PULSE = 3
+FRAME_OK = 4
+FRAME_PING = 5
+FRAME_ERROR = 6
+FRAME_WR = 7
+FRAME_MODEL = 8
+FRAME_INTERACTIVE = 9
+
+# Keyed on the first two bytes of a frame. The pulse count response is the only one with a single character
+# prefix, so it is caught by the fallback in classify(). 'PI' can't be a pulse count because 'I' isn't ACH.
+_FRAME_TAGS = {
+    b'ID': FRAME_READ_MEMORY,
+    b'SS': FRAME_STROKE_START,
+    b'SE': FRAME_STROKE_END,
+    b'OK': FRAME_OK,
+    b'PI': FRAME_PING,
+    b'ER': FRAME_ERROR,
+    b'_W': FRAME_WR,
+    b'IV': FRAME_MODEL,
+    b'AI': FRAME_INTERACTIVE,
+    b'AK': FRAME_INTERACTIVE,
+}
+
+# The event type for each kind of frame that carries data after its prefix. Read memory responses are decoded by
+# read_replies() instead. Every other frame is recognised only by an exact match in _EXACT_FRAMES, so one that merely
+# starts with a known prefix (e.g. a garbled 'SS' or 'OK' frame) is dropped rather than reported as a valid event.
+_FRAME_EVENT_TYPES = {
+    FRAME_PULSE: 'pulse',
+    FRAME_MODEL: 'model',
+}
+
+# Frames that are always exactly the same bytes (no data) are recognised by a single lookup of the whole frame, before
+# it is even decoded. Each maps to (event type, raw frame as str).
+_EXACT_FRAMES: dict[bytes, tuple[str, str]] = {
+    response.encode('ascii'): (event_type, response) for response, event_type in (
+        (STROKE_START_RESPONSE, 'stroke_start'),
+        (STROKE_END_RESPONSE, 'stroke_end'),
+        (OK_RESPONSE, 'ok'),
+        (PING_RESPONSE, 'ping'),
+        (ERROR_RESPONSE, 'error'),
+        (WR_RESPONSE, 'wr'),
+        (INTERACTIVE_KEYPAD_RESET_RESPONSE, 'reset'),
+    )
+}
+
+def classify(line: bytes) -> int:
+    """
+    Tags a frame received from the S4 according to its response prefix.
+    Args: line (bytes): A single frame, without its LINE_TERMINATOR.
+    Returns:
+        int: One of the FRAME_* tags, or FRAME_UNKNOWN if the prefix isn't recognised.
+    """
+    tag = _FRAME_TAGS.get(line[:2])
+    if tag is not None:
+        return tag
+    if line[:1] == b'P':
+        return FRAME_PULSE
+    return FRAME_UNKNOWN
+
+def iter_frames(buf: bytearray, start: int = 0) -> Iterator[tuple[int, bytes]]:
+    """
+    Consumes all complete frames from a receive buffer.
+    Args:
+        buf (bytearray): Bytes read from the serial port. Complete frames are removed from the buffer and any
+            trailing partial frame is left in place to be completed by the next read.
+        start (int): Where to start looking for a terminator. The partial frame left by the previous call holds none,
+            so passing its length (the length of buf before the latest read was appended) means that each byte is only
+            searched once.
+    Yields:
+        tuple: (tag, frame) for each non-empty frame, where tag is the result of classify(frame). Frames are split
+        on the LF of LINE_TERMINATOR, as readline() would, and stripped of the CR and any other surrounding whitespace.
+    """
+    end = buf.rfind(b'\n', start)
+    if end < 0:
+        return
+    complete = bytes(buf[:end])
+    del buf[:end + 1]
+    for line in complete.split(b'\n'):
+        line = line.strip()
+        if line:
+            yield classify(line), line
+
+# POLL PLANS
+'''
+The request loops poll the same addresses over and over again, so the filtering of MEMORY_MAP by frequency and
+exclude_from_poll_loop, the substitution of composite reads and the lookup of the request packet for each address,
+is done once at import time.
+The S4 is walked through its registers in ascending address order, whatever the order of MEMORY_MAP, but within a
+block of adjacent registers the order of MEMORY_MAP is kept. That is where a value split across registers is listed
+most significant component first (e.g. the display clock, hr before min, sec and sec_dec), which is the order in which
+those components must be requested (see the MEMORY_MAP notes).
+Each plan is a tuple of (address, category, request packet) records. The category is retained because it can be
+switched on and off by the application at runtime, so it must still be checked by the request loops.
+'''
+
+def _build_poll_plan(high: bool) -> tuple[tuple[str, str, bytes], ...]:
+    # Split the registers into blocks of adjacent registers, in ascending address order
+    blocks: list[list[MemEntry]] = []
+    end = None
+    for entry in sorted(_ENTRIES, key=lambda entry: entry.addr):
+        if entry.high != high or entry.exclude:
+            continue
+        if entry.addr != end:
+            blocks.append([])
+        blocks[-1].append(entry)
+        end = entry.addr + entry.size
+
+    map_order = {entry.address: index for index, entry in enumerate(_ENTRIES)}
+    plan = []
+    for block in blocks:
+        for entry in sorted(block, key=lambda entry: map_order[entry.address]):
+            read = _COMPOSITE_BY_ADDRESS.get(entry.address, entry)
+            record = (read.address, read.category, read.request_frame)
+            if record not in plan:
+                plan.append(record)     # A composite read is polled once, in place of the first register it spans
+    return tuple(plan)
+
+_POLL_PLAN_HIGH = _build_poll_plan(high=True)
+_POLL_PLAN_LOW = _build_poll_plan(high=False)
+
+# The response header, as received (e.g. b'IDS1A0'), that answers each read memory request packet, so that a request loop
+# can tell when its request has been answered
+_RESPONSE_HEADER_OF_REQUEST: dict[bytes, bytes] = {
+    read.request_frame: read.response_header.encode('ascii') for read in (*_ENTRIES, *_COMPOSITES)
+}
+
+def get_poll_plan(freq: str) -> tuple[tuple[str, str, bytes], ...]:
+    """
+    Gets the precomputed poll plan for a request loop.
+    Args: freq (str): The frequency of the request loop, either 'high' or 'low'.
+    Returns:
+        tuple: (address, category, request packet) records for every address to be polled at that frequency.
+    """
+    return _POLL_PLAN_HIGH if freq == "high" else _POLL_PLAN_LOW
+
 # FLAG BIT FIELDS
+'''
+The flag registers are 8-bit, so the names of the flags set in every possible value of each register are computed once
+at import time, and describe() is then a table lookup rather than a walk over the enum members.
+'''
+def _flag_names_table(flag_cls: type[IntFlag]) -> tuple[tuple[str, ...], ...]:
+    members = [(member.value, member.name) for member in flag_cls]
+    return tuple(tuple(name for value, name in members if byte & value) for byte in range(256))
+
+def _describe_flags(flags: IntFlag, names: tuple[tuple[str, ...], ...]) -> list[str]:
+    if 0 <= flags.value < len(names):
+        return list(names[flags.value])
+    return [member.name for member in type(flags) if member in flags]
+
 class WorkoutMode(IntFlag):
     ZONE_HEARTRATE              = 1 << 0  # fzone_hr
     ZONE_INTENSITY              = 1 << 1  # fzone_int
@@ -496,11 +877,11 @@ class WorkoutMode(IntFlag):
 
     @classmethod
     def changed_workout_bits(cls, old: int, new: int) -> bool:
-        return bool((old ^ new) & cls.WORKOUT_MASK)
+        return bool((old ^ new) & _WORKOUT_MASK)
 
     @classmethod
     def changed_zone_bits(cls, old: int, new: int) -> bool:
-        return bool((old ^ new) & cls.ZONE_MASK)
+        return bool((old ^ new) & _ZONE_MASK)
 
     def has_workout_set(self) -> bool:
         return bool(self & self.WORKOUT_MASK)
@@ -538,7 +919,12 @@ class WorkoutMode(IntFlag):
             >>> mode.describe()
             ['WORKOUT_DURATION', 'ZONE_HEARTRATE']
         """
-        return [mode.name for mode in WorkoutMode if mode in self]
+        return _describe_flags(self, _WORKOUT_MODE_NAMES)
+
+_WORKOUT_MODE_NAMES = _flag_names_table(WorkoutMode)
+# Plain int masks, so that the change checks on raw register values stay in int arithmetic rather than building a WorkoutMode
+_WORKOUT_MASK = WorkoutMode.WORKOUT_MASK.value
+_ZONE_MASK = WorkoutMode.ZONE_MASK.value
 
 class DistanceMode(IntFlag):
     PROJECTED_HEADER            = 1 << 0  # fdist_fg_proj
@@ -581,7 +967,7 @@ class DistanceMode(IntFlag):
     @classmethod
     def get_single_unit_mode(cls, mode: 'DistanceMode') -> 'DistanceMode | None':
         unit_bits = mode & cls.UNIT_MASK
-        if unit_bits and (unit_bits.value & (unit_bits.value - 1)) == 0:
+        if unit_bits.value.bit_count() == 1:
             return unit_bits
         return None
 
@@ -596,7 +982,9 @@ class DistanceMode(IntFlag):
             >>> mode.describe()
             ['UNITS_STROKES']
         """
-        return [mode.name for mode in DistanceMode if mode in self]
+        return _describe_flags(self, _DISTANCE_MODE_NAMES)
+
+_DISTANCE_MODE_NAMES = _flag_names_table(DistanceMode)
     
 class IntensityMode(IntFlag):
     UNITS_MPS               = 1 << 0  # fint_fg_m_s
@@ -640,7 +1028,7 @@ class IntensityMode(IntFlag):
     @classmethod
     def get_single_unit_mode(cls, mode: 'IntensityMode') -> 'IntensityMode | None':
         unit_bits = mode & cls.UNIT_MASK
-        if unit_bits and (unit_bits.value & (unit_bits.value - 1)) == 0:
+        if unit_bits.value.bit_count() == 1:
             return unit_bits
         return None
 
@@ -655,7 +1043,9 @@ class IntensityMode(IntFlag):
             >>> mode.describe()
             ['UNITS_MPS']
         """
-        return [mode.name for mode in IntensityMode if mode in self]
+        return _describe_flags(self, _INTENSITY_MODE_NAMES)
+
+_INTENSITY_MODE_NAMES = _flag_names_table(IntensityMode)
     
 # CUSTOM EXCEPTIONS
 class SerialNotConnectedError(Exception):
@@ -665,65 +1055,113 @@ class EventParseError(Exception):
     pass
 
 # CUSTOM DATACLASS
-@dataclass
+@dataclass(slots=True)
 class S4Event:
     type: str
     value: Optional[int] = None
     raw: Optional[str] = None
-    at: int = int(round(time.time() * 1000))  # timestamp in ms
+    at: int = field(default_factory=lambda: time.time_ns() // 1_000_000)  # timestamp in ms
 
     @staticmethod
     def build(type: str, value: Optional[int] = None, raw: Optional[str] = None) -> 'S4Event':
-        return S4Event(type=type, value=value, raw=raw, at=int(round(time.time() * 1000)))
+        return S4Event(type=type, value=value, raw=raw, at=time.time_ns() // 1_000_000)
+
+    @classmethod
+    def parse_frame(cls, tag: int, line: bytes) -> list['S4Event']:
+        """
+        Parses a stripped frame tagged by classify() into the events it holds. Read memory responses can hold more than one
+        register (see COMPOSITE_READS), and so more than one event. Every other frame holds at most one, the type of
+        which is looked up from the tag.
+        """
+        exact = _EXACT_FRAMES.get(line)
+        if exact is not None:
+            return [cls.build(type=exact[0], raw=exact[1])]
+
+        # The S4 only sends ASCII. A corrupted byte decodes to U+FFFD rather than raising, and the frame is then checked
+        # like any other: a data-less frame no longer matches _EXACT_FRAMES, and a read memory response fails to decode,
+        # so either is rejected (and logged). Pulse count and model frames aren't decoded here, so they are passed on
+        # with their raw text as received.
+        cmd = line.decode('ascii', 'replace')
+
+        if tag == FRAME_READ_MEMORY:
+            return read_replies(cmd)
+
+        event_type = _FRAME_EVENT_TYPES.get(tag)
+        if event_type is None:
+            logger.warning("Unrecognised command line captured from S4: %s", cmd)
+            return []
+        return [cls.build(type=event_type, raw=cmd)]
 
     @classmethod
     def parse_line(cls, line: bytes) -> Optional['S4Event']:
-        try:
-            cmd = line.strip().decode('utf8')
-        except UnicodeDecodeError as e:
-            logger.error(f"Failed to decode line from S4: {line!r}, error: {e}")
-            return None
-
-        if cmd == STROKE_START_RESPONSE:
-            return cls.build(type='stroke_start', raw=cmd)
-        elif cmd == STROKE_END_RESPONSE:
-            return cls.build(type='stroke_end', raw=cmd)
-        elif cmd == OK_RESPONSE:
-            return cls.build(type='ok', raw=cmd)
-        elif cmd.startswith(MODEL_INFORMATION_RESPONSE):
-            return cls.build(type='model', raw=cmd)
-        elif cmd.startswith(READ_MEMORY_RESPONSE):
-            return read_reply(cmd)
-        elif cmd == PING_RESPONSE:
-            return cls.build(type='ping', raw=cmd)
-        elif cmd.startswith(PULSE_COUNT_RESPONSE):
-            return cls.build(type='pulse', raw=cmd)
-        elif cmd == ERROR_RESPONSE:
-            return cls.build(type='error', raw=cmd)
-        elif cmd == WR_RESPONSE:
-            return cls.build(type='wr', raw=cmd)
-        elif cmd == INTERACTIVE_KEYPAD_RESET_RESPONSE:
-            return cls.build(type='reset', raw=cmd)
-        else:
-            logger.warning(f"Unrecognised command line captured from S4: {cmd}")
-            return None
+        line = line.strip()
+        events = cls.parse_frame(classify(line), line)
+        return events[-1] if events else None
 
 # HELPER FUNCTIONS
-def find_port() -> str:
+S4_BY_ID_PATTERN = '/dev/serial/by-id/*WR-S4*'
+
+def _watch_for_new_ports() -> Any:
+    # Returns a started pyudev monitor of tty devices being added, so that the port scan can wait for the S4 to be plugged
+    # in rather than rescanning on a timer, or None if pyudev (an optional, Linux only dependency) isn't available.
+    try:
+        import pyudev
+    except ImportError:
+        return None
+    try:
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by('tty')
+        monitor.start()
+        return monitor
+    except Exception as e:
+        logger.debug(f"Could not monitor udev for new serial ports: {e}")
+        return None
+
+_PORT_CACHE: Optional[str] = None  # The last port on which the S4 was found. Enumerating ports is slow and the S4 rarely moves.
+
+def find_port(force: bool = False) -> str:
+    """
+    Finds the serial port to which the S4 monitor is connected, blocking until one is found.
+    Args: force (bool): If True, ignore the cached port and scan the ports again (e.g. because opening the cached port failed).
+    Returns:
+        str: The path of the serial port (e.g. '/dev/ttyACM0').
+    """
+    global _PORT_CACHE
+    if _PORT_CACHE and not force:
+        logger.debug(f"Using cached serial port: {_PORT_CACHE}")
+        return _PORT_CACHE
+
+    _PORT_CACHE = None
     logger.info(f"Searching for serial port...")
     attempts = 0
+    monitor = None
     while True:
         # If a port isn't found, the code will remain in this loop.
         attempts += 1
-        ports = serial.tools.list_ports.comports()
-        for (i, (path, name, _)) in enumerate(ports):
-            if "WR-S4" in name:
-                logger.info(f"Serial port found: {path}")
-                return path
+        # On Linux, udev links each USB serial device under /dev/serial/by-id by a name that includes its description,
+        # so the S4 can be found with a single directory lookup rather than by enumerating every port.
+        links = glob.glob(S4_BY_ID_PATTERN)
+        if links:
+            path = os.path.realpath(links[0])
+            logger.info(f"Serial port found: {path}")
+            _PORT_CACHE = path
+            return path
+
+        import serial.tools.list_ports  # Only needed when enumerating the ports, so not imported with the module
+        for port in serial.tools.list_ports.comports():
+            if "WR-S4" in port.description:
+                logger.info(f"Serial port found: {port.device}")
+                _PORT_CACHE = port.device
+                return port.device
         
         if ((attempts - 1) % 360) == 0: # message every ~30 minutes
             logger.warning(f"Serial port not found in {attempts}; retrying every {PORT_SCAN_RETRY_DELAY}s")
-        time.sleep(PORT_SCAN_RETRY_DELAY)
+        if attempts == 1:
+            monitor = _watch_for_new_ports()    # Only once the S4 is known to be missing. The wait is still bounded, so nothing is missed.
+        if monitor is None:
+            time.sleep(PORT_SCAN_RETRY_DELAY)
+        else:
+            monitor.poll(timeout=PORT_SCAN_RETRY_DELAY)     # Returns as soon as a tty device is added
 
 
 def get_address_of_data_type(data_type: str) -> str:
@@ -733,9 +1171,9 @@ def get_address_of_data_type(data_type: str) -> str:
     Returns:
         str: The register address where the data type is stored in S4 memory
     """
-    for address, data in MEMORY_MAP.items():
-        if data['type'] == data_type:
-            return address
+    address = _ADDRESS_OF_TYPE.get(data_type)
+    if address is not None:
+        return address
     logger.error(f"Cannot request data type {data_type} via serial connection because the data type has not been configured in MEMORY_MAP.")
     raise ValueError(f"Data type {data_type} not found in MEMORY MAP")
     
@@ -750,58 +1188,54 @@ def is_live_thread(t: Optional[threading.Thread]) -> bool:
     return t is not None and t.is_alive()
 
 
-def read_reply(cmd: str) -> Optional[S4Event]:
+def read_replies(cmd: str) -> list[S4Event]:
+    """
+    Decodes a read memory response into an event for each register it holds.
+    Args: cmd (str): The read memory response (e.g. 'IDD0550102').
+    Returns:
+        list: One S4Event per register, in the order received. More than one only for a composite read. Empty if
+        the response could not be decoded.
+    """
     if len(cmd) < 6:
-        logger.warning(f"Failed to parse S4 read memory response: the received command was too short to contain address: {cmd!r}")
-        return None
+        logger.warning("Failed to parse S4 read memory response: the received command was too short to contain address: %r", cmd)
+        return []
     
-    address = cmd[3:6]
-    memory = MEMORY_MAP.get(address)
-    if not memory:
-        logger.warning(f"Failed to parse S4 read memory response: MEMORY_MAP has not been configured for the recieved command: {cmd!r}.")
-        return None
-
-    size = memory['size']
-    endian = memory.get('endian', 'big')  # Default to big if unspecified
+    decoder = _READ_DECODERS.get(cmd[:6])
+    if decoder is None:
+        address = cmd[3:6]
+        if address not in MEMORY_MAP:
+            logger.warning("Failed to parse S4 read memory response: MEMORY_MAP has not been configured for the recieved command: %r.", cmd)
+        else:
+            logger.warning("Failed to parse S4 read memory response: Size code in command %r does not match size '%s' configured for address %s", cmd, MEMORY_MAP[address]['size'], address)
+        return []
 
-    # Get the appropriate function to extract the value from the command string depending on whether it's single, double, triple.
-    # Default to None if size isn't found in PARSE_MAP
-    value_fn = SIZE_PARSE_MAP.get(size, lambda cmd: None) 
+    n_chars, fields = decoder
+    value_str = cmd[6:6 + n_chars]
 
-    if not value_fn:
-        logger.warning(f"Failed to parse S4 read memory response: Unsupported size '{size}' for address {address} in command: {cmd!r}")
-        return None
-    
-    # Apply the function to extract the value from the command (will return zero length str if cmd is too short for example)
-    value_str = value_fn(cmd)
-
-    if value_str is None:
-        logger.warning(f"Failed to parse S4 read memory reponse: Could not extract a value of size: {size} from command: {cmd!r}")
-        return None
+    if len(value_str) != n_chars:
+        logger.warning("Failed to parse S4 read memory reponse: Expected %d characters of value but got %d in command: %r", n_chars, len(value_str), cmd)
+        return []
     
+    values = []
     try:
-        value = int(value_str, base=memory['base'])
-    except ValueError as e:
-        logger.warning(f"Failed to parse S4 read memory reponse: Invalid number format in value '{value_str}' from command: {cmd!r} — Error: {e}")
-        return None
-    
-    # Swap bytes if necessary (not applicable for single, so only for double and triple types)
-    if endian == 'little':
-        try:
-            if size == 'double' and len(value_str) == 4:
-                high = int(value_str[0:2], 16)
-                low = int(value_str[2:4], 16)
-                value = (low << 8) | high
-            elif size == 'triple' and len(value_str) == 6:
-                high = int(value_str[0:2], 16)
-                mid  = int(value_str[2:4], 16)
-                low  = int(value_str[4:6], 16)
-                value = (low << 16) | (mid << 8) | high
-        except ValueError as e:
-            logger.warning(f"Failed to parse S4 read memory reponse: Error during byte-swapping for little-endian data in command: {cmd!r} — {e}")
-            return None
+        for offset, entry in fields:
+            values.append((entry.type, entry.decode(value_str[offset:offset + 2 * entry.size])))
+    except (ValueError, KeyError) as e:
+        logger.warning("Failed to parse S4 read memory reponse: Invalid number format in value '%s' from command: %r — Error: %s", value_str, cmd, e)
+        return []
         
-    return S4Event.build(memory['type'], value, cmd)
+    return [S4Event.build(type, value, cmd) for type, value in values]
+
+
+def read_reply(cmd: str) -> Optional[S4Event]:
+    """
+    Decodes a read memory response for a single register.
+    Returns:
+        S4Event: The event for the register. For a composite read, the event for the last register received.
+        None: If the response could not be decoded.
+    """
+    events = read_replies(cmd)
+    return events[-1] if events else None
 
 
 def get_command_string(prefix_type: str, request_type: str, address: Optional[str] = None) -> str:
@@ -844,7 +1278,9 @@ class Rower(object):
 
     def __init__(self, options=None):
         logger.debug("Entering Rower class Init")
-        self._callbacks = set()
+        self._callbacks: dict[Callable[[S4Event], None], None] = {}   # Used as an insertion-ordered set, so callbacks are called in the order they were registered
+        self._callbacks_snapshot: tuple[Callable[[S4Event], None], ...] = ()     # What the dispatch thread iterates, rebuilt on (de)registration
+        self._callbacks_lock = threading.Lock()     # Serialises (de)registrations, so that a stale snapshot can't overwrite a newer one
         self._stop_event = threading.Event()
         # if options and options.demo:
         #     from demo import FakeS4
@@ -855,13 +1291,21 @@ class Rower(object):
         self._serial = serial.Serial()
         self._serial.baudrate = 19200
         self._serial.timeout = SERIAL_READ_TIMEOUT
-        self._serial_lock = threading.RLock()
+        self._serial.write_timeout = SERIAL_WRITE_TIMEOUT
+        self._serial_lock = threading.Lock()
+        self._port_open = threading.Event()     # Mirrors self._serial.is_open, so the loops can check it without taking the lock
         self._high_freq_request_thread = None
         self._low_freq_request_thread = None        
         self._capture_thread = None
+        self._dispatch_thread = None
+        self._event_queue: queue.SimpleQueue[Optional[S4Event]] = queue.SimpleQueue()
         self._response_event = threading.Event()  # For on-demand responses
         self._current_response = None
+        self._rx_buf = bytearray()                # Bytes received from the S4 that don't yet make up a complete frame
+        self._on_demand_buf = bytearray()         # As _rx_buf, for the responses read by capture_on_demand_response()
         self._request_categories: dict[str, bool] = DEFAULT_REQUEST_CATEGORIES.copy()
+        self._request_categories_version = 0     # Incremented whenever a category is switched, so that the request loops refilter their poll plans
+        self._awaited_responses: dict[bytes, threading.Event] = {}  # Response header -> event set by the capture thread when it arrives
 
         self._start_threads()
 
@@ -870,41 +1314,57 @@ class Rower(object):
         self._high_freq_request_thread = build_daemon(target=lambda: self._start_requesting("high"))
         self._low_freq_request_thread = build_daemon(target=lambda: self._start_requesting("low"))
         self._capture_thread = build_daemon(target=self._start_capturing)
+        # Each dispatch thread gets its own queue, so that one left draining the queue of a closed connection can't take
+        # the events (or the stop sentinel) meant for its successor
+        event_queue = self._event_queue = queue.SimpleQueue()
+        self._dispatch_thread = build_daemon(target=lambda: self._start_dispatching(event_queue))
+        self._dispatch_thread.start()
         self._high_freq_request_thread.start()
         self._low_freq_request_thread.start()
         self._capture_thread.start()
         logger.debug("S4 data request and capture threads started.")
 
     def is_connected(self) -> bool:
-        with self._serial_lock:
-            serial_open = self._serial.is_open
         return (
-            serial_open and
+            self._port_open.is_set() and
             is_live_thread(self._high_freq_request_thread) and
             is_live_thread(self._capture_thread)
         )
 
     def _find_serial(self) -> None:
+        # The caller must hold self._serial_lock, which is not reentrant
+        rescan = False
         while True:
             if not self._demo:
-                with self._serial_lock:
-                    self._serial.port = find_port()
+                self._serial.port = find_port(force=rescan)
 
             try:
                 logger.debug("Attempting to open serial port...")
-                with self._serial_lock:
-                    self._serial.open()
+                self._serial.open()
+                self._set_low_latency()
+                self._port_open.set()
                 logger.info("Serial port open.")
                 break # Successfully opened, exit loop
             except serial.SerialException as e:
                 logger.error(f"Error encountered opening serial port: {e}. Retrying in {SERIAL_OPEN_RETRY_DELAY} seconds")
+                rescan = True   # The cached port may be stale, so scan for the port again on the next attempt
                 time.sleep(SERIAL_OPEN_RETRY_DELAY)
-                with self._serial_lock:
-                    try:
-                        self._serial.close()
-                    except Exception as e_close:
-                        logger.warning(f"Failed to close serial during retry: {e_close}")
+                try:
+                    self._serial.close()
+                except Exception as e_close:
+                    logger.warning(f"Failed to close serial during retry: {e_close}")
                 
+    def _set_low_latency(self) -> None:
+        # By default the Linux FTDI driver holds received bytes for up to 16ms before passing them on. Setting
+        # ASYNC_LOW_LATENCY on the port passes each S4 packet on as soon as it arrives. pyserial only offers this on Linux.
+        set_low_latency_mode = getattr(self._serial, 'set_low_latency_mode', None)
+        if set_low_latency_mode is None:
+            return
+        try:
+            set_low_latency_mode(True)
+        except (ValueError, OSError) as e:
+            logger.debug(f"Could not set serial port to low latency mode: {e}")
+
     def open(self) -> None:
         # Any caller asking for Rower.open() will not recieve control back until:
         # - the port is found, otherwise the code loops in find_port()
@@ -913,6 +1373,7 @@ class Rower(object):
         with self._serial_lock:
             if self._serial and self._serial.is_open:
                 logger.debug("Closing existing serial connection.")
+                self._port_open.clear()
                 try:
                     self._serial.close()
                 except serial.SerialException as e:
@@ -926,44 +1387,65 @@ class Rower(object):
             self._start_threads()
 
         logger.info("Initiating communication with S4 monitor.")
-        self.write(USB_REQUEST)
+        self._write_frame(USB_REQUEST_B)
 
     def close(self) -> None:
         logger.debug("Closing serial communications with S4.")
         self.notify_callbacks(S4Event.build("exit"))
+        self._event_queue.put(None)     # Stops the dispatch thread once it has delivered the exit event
         if self._stop_event:
             self._stop_event.set()
         with self._serial_lock:
-            if self._serial and self._serial.is_open:
-                self.write(EXIT_REQUEST)
+            is_open = self._serial and self._serial.is_open
+        if is_open:
+            self._write_frame(EXIT_REQUEST_B)   # Takes the serial lock itself, so it is called before the lock is reacquired
+            with self._serial_lock:
+                self._serial.flush()    # Make sure the exit request has left the port before it is closed
                 time.sleep(0.1)  # time for capture and request loops to stop running
+                self._port_open.clear()
                 self._serial.close()
 
     def write(self, raw: str) -> None:
+        self._write_frame(_encode_request(raw))
+
+    def _write_frame(self, frame: bytes) -> None:
         try:
             with self._serial_lock:
-                self._serial.write(str.encode(raw.upper() + '\r\n'))
-                self._serial.flush()
+                # No flush(): on POSIX it is a tcdrain() that would hold the lock until the UART has sent the frame
+                self._serial.write(frame)
         except Exception as e:
             logger.error(f"Serial write communication error: {e}. Trying to reconnect.")
             self.open()
 
     def _start_capturing(self) -> None:
         while not self._stop_event.is_set():
-            if self._serial.is_open:
+            if self._port_open.is_set():
                 try:
                     with self._serial_lock:
-                        line = self._serial.readline()  # The self._serial.timeout ensures this read doesn't block indefinitely and prevents the lock from being held too long 
+                        # Only read what is already waiting, so that the lock is never held while blocking for data and the
+                        # request threads can write in the meantime
+                        n_waiting = self._serial.in_waiting
+                        chunk = self._serial.read(n_waiting) if n_waiting else b''
 
-                    if not line:
-                        time.sleep(0.005) # avoid tight loop, reduce CPU load
+                    if not chunk:
+                        self._wait_for_input()
                     else:
-                        event = S4Event.parse_line(line)
-                        if event:
-                            self.notify_callbacks(event)
+                        scanned = len(self._rx_buf)
+                        self._rx_buf += chunk
+                        for tag, line in iter_frames(self._rx_buf, scanned):
+                            if tag == FRAME_READ_MEMORY:
+                                response_received = self._awaited_responses.pop(line[:6], None)
+                                if response_received is not None:
+                                    response_received.set()     # Let the request loop send its next request straight away
+                            for event in S4Event.parse_frame(tag, line):
+                                self.notify_callbacks(event)
+                        if len(self._rx_buf) > MAX_PARTIAL_FRAME:
+                            logger.warning("Discarding unterminated data received from S4: %r", bytes(self._rx_buf))
+                            self._rx_buf.clear()
                     
                 except serial.SerialException as e:
                     logger.error(f"Serial read communication error: {e}. Trying to reset input buffer.")
+                    self._rx_buf.clear()
                     try:
                         with self._serial_lock:
                             self._serial.reset_input_buffer()
@@ -976,26 +1458,51 @@ class Rower(object):
             else:
                 self._stop_event.wait(0.1)
 
+    def _wait_for_input(self, timeout: float = SERIAL_IDLE_WAIT) -> None:
+        # Where the port has a file descriptor, sleep in select() until the S4 sends something, rather than waking up
+        # periodically to check. Otherwise (e.g. on Windows) fall back to a short poll to avoid a tight loop.
+        fileno = getattr(self._serial, 'fileno', None)
+        if fileno is not None:
+            try:
+                select.select([fileno()], [], [], timeout)
+                return
+            except (OSError, ValueError, serial.SerialException):
+                pass
+        self._stop_event.wait(0.002)
+
     def set_request_category(self, category: str, enabled: bool) -> None:
         self._request_categories[category] = enabled
+        self._request_categories_version += 1
+
+    def _filter_poll_plan(self, freq: str) -> tuple[bytes, ...]:
+        # Drop the addresses in categories for which the flag has been set to false in the _request_categories dict
+        return tuple(
+            frame for _, category, frame in get_poll_plan(freq)
+            if self._request_categories.get(category) is not False
+        )
         
     def _start_requesting(self, freq: str ="high") -> None:
         counter = 0
+        frames: tuple[bytes, ...] = ()
+        frames_version = -1
+        response_received = threading.Event()
         while not self._stop_event.is_set():
-            with self._serial_lock:
-                is_open = self._serial.is_open
-
-            if is_open:
-                for address, meta in MEMORY_MAP.items():
-                    if meta.get("frequency", "high") != freq:
-                        continue    # This address doesn't match the frequency we're looking for, so skip to the next address in the loop
-                    if meta.get("exclude_from_poll_loop", False):
-                        continue    # The Memory Map specifies that this address should be excluded from the polling loop, so skip to the next address in the loop
-                    if self._request_categories.get(meta.get("category", "default")) is False:
-                        continue    # The address is in a category for which the flag has been set to false in the _request_categories dict, to the next address in the loop
-
-                    self.request_address(address)
-                    self._stop_event.wait(SERIAL_REQUEST_DELAY)
+            if self._port_open.is_set():
+                # The categories change rarely, so the poll plan is refiltered only when they do, not on every request
+                if frames_version != self._request_categories_version:
+                    frames_version = self._request_categories_version
+                    frames = self._filter_poll_plan(freq)
+
+                for frame in frames:
+                    # Pace the requests by the S4's responses, falling back to SERIAL_REQUEST_DELAY if one doesn't come
+                    header = _RESPONSE_HEADER_OF_REQUEST[frame]
+                    response_received.clear()
+                    self._awaited_responses[header] = response_received
+                    self._write_frame(frame)
+                    response_received.wait(SERIAL_REQUEST_DELAY)
+                    self._awaited_responses.pop(header, None)
+                    if self._stop_event.is_set():
+                        break
 
                 if freq == "low":
                     self._stop_event.wait(LOW_FREQ_PAUSE)
@@ -1010,7 +1517,7 @@ class Rower(object):
 
     def request_reset(self) -> None:
         logger.debug("Sending reset request to S4 via serial connection.")
-        self.write(RESET_REQUEST)
+        self._write_frame(RESET_REQUEST_B)
 
     def request_address(self, address: str) -> None:
         """
@@ -1021,9 +1528,7 @@ class Rower(object):
             logger.error(f"Cannot request address {address} via serial connection because the address has not been configured in MEMORY_MAP.")
             raise ValueError(f"Address {address} not found in MEMORY_MAP")
         
-        size = MEMORY_MAP[address]['size']
-        cmd = SIZE_MAP[size]['request']
-        self.write(cmd + address)
+        self._write_frame(REQUEST_FRAME[address])
 
 
     def request_on_demand(self, request_type: str, address: Optional[str] = None) -> Optional[S4Event]:
@@ -1042,11 +1547,16 @@ class Rower(object):
         Raises:
             Exception: If any error occurs during serial I/O or response handling.
         """
-        request = get_command_string('request', request_type, address)
-        expected_response_prefix = get_command_string('response', request_type, address)
+        read_commands = _READ_COMMANDS.get(address) if request_type == READ_MEMORY_REQUEST else None
+        if read_commands is not None:
+            request, expected_response_prefix = read_commands
+        else:
+            request = get_command_string('request', request_type, address)
+            expected_response_prefix = get_command_string('response', request_type, address)
 
         try:
             self._serial.reset_input_buffer()
+            self._on_demand_buf.clear()
             self.write(request)
             if expected_response_prefix:
                 return self.capture_on_demand_response(expected_response_prefix)
@@ -1076,39 +1586,62 @@ class Rower(object):
         if not self._serial or not self._serial.is_open:
             raise SerialNotConnectedError("Serial port is not connected.")
             
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        # Wait for input for no longer than the time left, then read whatever is waiting in one go and split it into
+        # frames, rather than reading a byte at a time as readline() and read_until() do. The port's timeout is shared
+        # with the capture and request threads, so it is left alone. A trailing partial frame is kept in
+        # self._on_demand_buf for the next read.
+        prefix = expected_response_prefix.encode('ascii')    # Frames are matched as received, so only the response is decoded
+        deadline = time.monotonic() + timeout
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                self._wait_for_input(remaining)
+                waiting = self._serial.in_waiting
+                if not waiting:
+                    continue
+                chunk = self._serial.read(waiting)
+
+                scanned = len(self._on_demand_buf)
+                self._on_demand_buf += chunk
+                for _, line in iter_frames(self._on_demand_buf, scanned):
+                    if line.startswith(prefix):
+                        return S4Event.parse_line(line)
+                if len(self._on_demand_buf) > MAX_PARTIAL_FRAME:
+                    self._on_demand_buf.clear()     # Noise without a terminator, which can't be the response
+        except serial.SerialException as e:
+            logger.error(f"Serial read communication error: {e}. Trying to reset input buffer.")
             try:
-                line = self._serial.readline()
-                if not line:
-                    continue    # No data received, so return to the top of the while and iterate again.
-                    
-                cmd = line.strip().decode('utf8')
-                if cmd.startswith(expected_response_prefix):
-                    return S4Event.parse_line(line)
-            except serial.SerialException as e:
-                logger.error(f"Serial read communication error: {e}. Trying to reset input buffer.")
-                try:
-                    self._serial.reset_input_buffer()
-                except serial.SerialException as e2:
-                    logger.error(f"Could not reset serial input buffer: {e2}")
-                raise  # Re-raise the original serial exception
-            except TypeError as e:
-                logger.error(f"TypeError  error: {e}.")
-                raise
-        logger.warning(f"Timeout waiting for response with prefix {expected_response_prefix}")
-        raise TimeoutError(f"Timeout waiting for response with prefix {expected_response_prefix}")
+                self._serial.reset_input_buffer()
+            except serial.SerialException as e2:
+                logger.error(f"Could not reset serial input buffer: {e2}")
+            raise  # Re-raise the original serial exception
+        except TypeError as e:
+            logger.error(f"TypeError  error: {e}.")
+            raise
+        logger.warning("Timeout waiting for response with prefix %s", expected_response_prefix)
+        raise TimeoutError("Timeout waiting for response with prefix " + expected_response_prefix)
 
     def register_callback(self, cb: Callable[[S4Event], None]) -> None:
-        logger.debug(f"Registering serial communication callback - {cb}")
-        self._callbacks.add(cb)
+        logger.debug("Registering serial communication callback - %s", cb)
+        with self._callbacks_lock:
+            self._callbacks[cb] = None
+            self._callbacks_snapshot = tuple(self._callbacks)
 
     def remove_callback(self, cb: Callable[[S4Event], None]) -> None:
-        logger.debug(f"De-registering serial communication callback - {cb}")
-        self._callbacks.remove(cb)
+        logger.debug("De-registering serial communication callback - %s", cb)
+        with self._callbacks_lock:
+            del self._callbacks[cb]
+            self._callbacks_snapshot = tuple(self._callbacks)
 
     def notify_callbacks(self, event: S4Event) -> None:
-#        logger.debug(f"Rower.notify_callbacks: Notifing callbacks of event {event}")
-        for cb in self._callbacks:
-#            logger.debug(f"Rower.notify_callbacks: Notifying callback {cb} of event {event}")
-            cb(event)
\ No newline at end of file
+        # The callbacks are called on the dispatch thread, so that a slow callback doesn't hold up the serial reads
+        self._event_queue.put(event)
+
+    def _start_dispatching(self, event_queue: 'queue.SimpleQueue[Optional[S4Event]]') -> None:
+        while (event := event_queue.get()) is not None:
+#            logger.debug("Rower._start_dispatching: Notifing callbacks of event %s", event)
+            for cb in self._callbacks_snapshot:
+#                logger.debug("Rower._start_dispatching: Notifying callback %s of event %s", cb, event)
+                try:
+                    cb(event)
+                except Exception:
+                    logger.exception(f"Callback {cb} failed to handle event {event}")
\ No newline at end of file
@@ -97,7 +97,7 @@ def monitor_threads():
         time.sleep(10)  # Check every 10 seconds
 
 def stop_threads(signal_received, frame):
-    """Handle graceful shutdown on Ctrl+C."""
+    """Handle graceful shutdown on Ctrl+C or SIGTERM."""
     print("\nStopping WRowFusion...")
     sys.exit(0)
 
@@ -110,12 +110,24 @@ def ensure_database_exists():
 if __name__ == "__main__":
     print("Starting WRowFusion...")
     
-    # Handle Ctrl+C to stop gracefully
-    signal.signal(signal.SIGINT, stop_threads)
+    # Use uvloop for the asyncio loops (BLE HRM client, websockets server) when
+    # it is installed. The policy is process-wide, so it must be set before
+    # those threads call asyncio.run.
+    try:
+        import asyncio
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+    
+    # Block the shutdown signals before any threads are started so that every
+    # thread inherits the mask and only the main thread's sigwait sees them.
+    shutdown_signals = {signal.SIGINT, signal.SIGTERM}
+    signal.pthread_sigmask(signal.SIG_BLOCK, shutdown_signals)
     
     ensure_database_exists()
     start_threads()
     
-    # Keep main thread running
-    while True:
-        signal.pause()
\ No newline at end of file
+    # Keep main thread parked until Ctrl+C or a service stop
+    stop_threads(signal.sigwait(shutdown_signals), None)
\ No newline at end of file
@@ -1,6 +1,24 @@
 import pytest
 from src.hr.heart_rate import HeartRateMonitor  # Adjust if it's located elsewhere
 
+class FakeClock:
+    """Monotonic nanosecond clock that only moves when told to."""
+    def __init__(self):
+        self.now_ns = 0
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        self.advance_ns(int(seconds * 1_000_000_000))
+
+    def advance_ns(self, ns: int) -> None:
+        self.now_ns += ns
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
 @pytest.fixture
-def heart_rate_monitor():
-    return HeartRateMonitor()
\ No newline at end of file
+def heart_rate_monitor(clock):
+    return HeartRateMonitor(clock=clock)
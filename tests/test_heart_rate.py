@@ -1,25 +1,28 @@
-import time
+from src.hr.heart_rate import HRM_TIMEOUT_NS
 
 def test_initial_heart_rate(heart_rate_monitor):
     assert heart_rate_monitor.get_heart_rate() == 0
 
-def test_update_and_get_hr(heart_rate_monitor):
-    heart_rate_monitor.update_bluetooth_hr(75)
+def test_update_and_get_hr(heart_rate_monitor, clock):
+    heart_rate_monitor.update_heart_rate(75)
     assert heart_rate_monitor.get_heart_rate() == 75
 
     # Test recency check (simulate time delay)
-    time.sleep(2)
+    clock.advance(2)
     assert heart_rate_monitor.get_heart_rate() == 75  # still recent
 
-    time.sleep(10)
+    clock.advance(10)
     assert heart_rate_monitor.get_heart_rate() == 0  # too old, rejected
 
-def test_get_most_recent_hr(heart_rate_monitor):
-    heart_rate_monitor.update_bluetooth_hr(75)
-    time.sleep(1)
-    heart_rate_monitor.update_ant_hr(85)
+def test_get_most_recent_hr(heart_rate_monitor, clock):
+    heart_rate_monitor.update_heart_rate(75)
+    clock.advance(1)
+    heart_rate_monitor.update_heart_rate(85)
     assert heart_rate_monitor.get_heart_rate() == 85
 
-    time.sleep(1)
-    heart_rate_monitor.update_bluetooth_hr(95)
-    assert heart_rate_monitor.get_heart_rate() == 95
+    # The latest update restarts the staleness timeout
+    clock.advance_ns(HRM_TIMEOUT_NS - 1)
+    assert heart_rate_monitor.get_heart_rate() == 85
+
+    clock.advance_ns(1)
+    assert heart_rate_monitor.get_heart_rate() == 0  # timed out exactly HRM_TIMEOUT_NS after the latest update
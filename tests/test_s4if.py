@@ -1,7 +1,7 @@
 import pytest
 from collections import Counter
 
-from src.s4.s4if import MEMORY_MAP, SIZE_MAP, SIZE_PARSE_MAP  # adjust import path as needed
+from src.s4.s4if import COMPOSITE_READS, MEMORY_MAP, SIZE_BYTES, SIZE_MAP, SIZE_PARSE_MAP, S4Event, get_poll_plan, read_replies  # adjust import path as needed
 
 def test_memory_map_has_unique_addresses():
     """Ensure all addresses in MEMORY_MAP are unique."""
@@ -48,4 +48,54 @@ def test_size_map_has_request_and_response_keys():
         assert 'request' in entry, f"Missing 'request' key for size '{size}'"
         assert isinstance(entry['request'], str), f"Request prefix for size '{size}' must be a string"
         assert 'response' in entry, f"Missing 'response' key for size '{size}'"
-        assert isinstance(entry['response'], str), f"Response prefix for size '{size}' must be a string"
\ No newline at end of file
+        assert isinstance(entry['response'], str), f"Response prefix for size '{size}' must be a string"
+
+def test_composite_reads_decode_like_individual_reads():
+    """Ensure each register in a composite read decodes to the same event as a read of that register alone."""
+    for address, size in COMPOSITE_READS.items():
+        start = int(address, 16)
+        registers = sorted(
+            (a for a in MEMORY_MAP if start <= int(a, 16) < start + SIZE_BYTES[size]),
+            key=lambda a: int(a, 16),
+            reverse=True,
+        )
+        payloads = {a: f"{int(a, 16) % 50 + 10:02d}" * SIZE_BYTES[MEMORY_MAP[a]['size']] for a in registers}
+        expected = [
+            read_replies(SIZE_MAP[MEMORY_MAP[a]['size']]['response'] + a + payloads[a])[0] for a in registers
+        ]
+        events = read_replies(SIZE_MAP[size]['response'] + address + "".join(payloads[a] for a in registers))
+        assert [(e.type, e.value) for e in events] == [(e.type, e.value) for e in expected], f"Composite read at '{address}' decoded differently"
+
+
+def test_poll_plans_poll_each_address_once():
+    """Ensure neither request loop polls an address twice."""
+    for freq in ("high", "low"):
+        addresses = [address for address, _, _ in get_poll_plan(freq)]
+        assert len(addresses) == len(set(addresses)), f"The '{freq}' poll plan polls an address more than once"
+
+def test_poll_plan_requests_clock_hr_before_the_rest_of_the_clock():
+    """Ensure the display clock is requested most significant component first, as MEMORY_MAP lists it."""
+    addresses = [address for address, _, _ in get_poll_plan("high")]
+    assert addresses.index('1E3') < addresses.index(next(a for a in addresses if a in ('1E0', '1E1', '1E2')))
+
+
+@pytest.mark.parametrize("line", [b"SS\xff", b"SSX", b"SE1234", b"OKAY", b"OK\xff", b"ERRORX", b"PINGX", b"_WR_X"])
+def test_garbled_data_less_frames_are_dropped(line):
+    """Ensure a frame that only starts like a data-less response (SS, SE, OK, ERROR, PING, _WR_) isn't parsed as one."""
+    assert S4Event.parse_line(line + b"\r\n") is None
+
+
+@pytest.mark.parametrize("line, expected", [
+    (b"SS", "stroke_start"), (b"SE", "stroke_end"), (b"OK", "ok"), (b"ERROR", "error"), (b"PING", "ping"),
+    (b"_WR_", "wr"), (b"AKR", "reset"), (b"P42", "pulse"), (b"IV40210", "model"),
+])
+def test_valid_frames_are_parsed(line, expected):
+    """Ensure each kind of response frame that the S4 sends is parsed into its event type."""
+    event = S4Event.parse_line(line + b"\r\n")
+    assert event is not None and event.type == expected
+
+
+@pytest.mark.parametrize("line", [b"S\xff", b"\xffS", b"OK\xff", b"PIN\xff", b"IDS1\xff012", b"IDS1A0\xff2", b"IDT14000\xff000"])
+def test_corrupted_frames_are_not_mistaken_for_valid_ones(line):
+    """Ensure a frame with a non-ASCII byte in it is rejected rather than parsed into an event."""
+    assert S4Event.parse_line(line + b"\r\n") is None